@@ -54,7 +54,8 @@ import os
 import logging
 import time
 import asyncio
-from typing import Dict, List, Union, Tuple
+import queue
+from typing import Dict, List, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -92,6 +93,9 @@ PDF_SERVICE_URL = os.getenv("PDF_SERVICE_URL", "http://localhost:8003")
 AGENT_SERVICE_URL = os.getenv("AGENT_SERVICE_URL", "http://localhost:8964")
 TTS_SERVICE_URL = os.getenv("TTS_SERVICE_URL", "http://localhost:8889")
 
+# How often process_pdf_task checks the status subscription while waiting for updates
+JOB_UPDATE_POLL_INTERVAL = 5  # seconds
+
 # MP3 Cache TTL
 MP3_CACHE_TTL = 60 * 60 * 4  # 4 hours
 
@@ -215,9 +219,10 @@ def process_pdf_task(
     """
     with telemetry.tracer.start_as_current_span("api.process_pdf_task") as span:
         span.set_attribute("job_id", job_id)
+        job_updates = None
         try:
-            pubsub = redis_client.pubsub()
-            pubsub.subscribe("status_updates:all")
+            # Receive this job's updates from the manager's shared Redis subscription
+            job_updates = manager.subscribe_job(job_id)
 
             # Store all original PDFs
             for idx, (content, _) in enumerate(files_and_types):
@@ -256,100 +261,108 @@ def process_pdf_task(
             # Monitor services
             current_service = ServiceType.PDF
             while True:
-                message = pubsub.get_message()
-                if message and message["type"] == "message":
-                    update = StatusUpdate.model_validate_json(message["data"].decode())
-
-                    if update.job_id == job_id:
-                        logger.info(f"Received update for job {job_id}: {update}")
-
-                        if update.status == JobStatus.FAILED:
-                            raise Exception(f"{update.service}: {update.message}")
-
-                        if update.status == JobStatus.COMPLETED:
-                            if current_service == ServiceType.PDF:
-                                # Get PDF metadata list
-                                pdf_metadata_list = requests.get(
-                                    f"{PDF_SERVICE_URL}/output/{job_id}"
-                                ).json()
-
-                                # Start Agent Service with PDF metadata
-                                requests.post(
-                                    f"{AGENT_SERVICE_URL}/transcribe",
-                                    json={
-                                        "pdf_metadata": pdf_metadata_list,
-                                        "job_id": job_id,
-                                        **transcription_params.model_dump(),
-                                    },
-                                )
-                                current_service = ServiceType.AGENT
-
-                            elif current_service == ServiceType.AGENT:
-                                # Start TTS Service
-                                agent_result = requests.get(
-                                    f"{AGENT_SERVICE_URL}/output/{job_id}"
-                                ).json()
-
-                                # Store script result in minio
-                                storage_manager.store_file(
-                                    transcription_params.userId,
-                                    job_id,
-                                    json.dumps(agent_result).encode(),
-                                    f"{job_id}_agent_result.json",
-                                    "application/json",
-                                    transcription_params,
-                                )
-                                logger.info(
-                                    f"Stored agent result for {job_id} in minio, size: {len(json.dumps(agent_result).encode())} bytes"
-                                )
-
-                                requests.post(
-                                    f"{TTS_SERVICE_URL}/generate_tts",
-                                    json={
-                                        "dialogue": agent_result["dialogue"],
-                                        "job_id": job_id,
-                                        "voice_mapping": transcription_params.voice_mapping,  # Forward the voice mapping
-                                    },
-                                )
-                                current_service = ServiceType.TTS
-
-                            elif current_service == ServiceType.TTS:
-                                # Get final output and store it
-                                logger.info(
-                                    f"TTS completed for {job_id}, fetching and storing result"
-                                )
-                                audio_content = requests.get(
-                                    f"{TTS_SERVICE_URL}/output/{job_id}"
-                                ).content
-
-                                # Store in DB
-                                storage_manager.store_audio(
-                                    transcription_params.userId,
-                                    job_id,
-                                    audio_content,
-                                    f"{job_id}.mp3",
-                                    transcription_params,
-                                )
-
-                                logger.info(
-                                    f"Stored TTS result for {job_id}, size: {len(audio_content)} bytes, with TTL: {MP3_CACHE_TTL} seconds"
-                                )
-                                return audio_content
-
-                time.sleep(0.01)
+                try:
+                    message = job_updates.get(timeout=JOB_UPDATE_POLL_INTERVAL)
+                except queue.Empty:
+                    # Jobs can legitimately be quiet for minutes; only fail if updates can't arrive
+                    if not manager.is_listening():
+                        raise Exception("Lost Redis status subscription")
+                    continue
+                if message is None:
+                    raise Exception("Lost Redis status subscription")
+
+                update = StatusUpdate.model_validate(message)
+                logger.info(f"Received update for job {job_id}: {update}")
+
+                if update.status == JobStatus.FAILED:
+                    raise Exception(f"{update.service}: {update.message}")
+
+                if update.status == JobStatus.COMPLETED:
+                    if current_service == ServiceType.PDF:
+                        # Get PDF metadata list
+                        pdf_metadata_list = requests.get(
+                            f"{PDF_SERVICE_URL}/output/{job_id}"
+                        ).json()
+
+                        # Start Agent Service with PDF metadata
+                        requests.post(
+                            f"{AGENT_SERVICE_URL}/transcribe",
+                            json={
+                                "pdf_metadata": pdf_metadata_list,
+                                "job_id": job_id,
+                                **transcription_params.model_dump(),
+                            },
+                        )
+                        current_service = ServiceType.AGENT
+
+                    elif current_service == ServiceType.AGENT:
+                        # Start TTS Service
+                        agent_result = requests.get(
+                            f"{AGENT_SERVICE_URL}/output/{job_id}"
+                        ).json()
+
+                        # Store script result in minio
+                        agent_result_bytes = json.dumps(agent_result).encode()
+                        storage_manager.store_file(
+                            transcription_params.userId,
+                            job_id,
+                            agent_result_bytes,
+                            f"{job_id}_agent_result.json",
+                            "application/json",
+                            transcription_params,
+                        )
+                        logger.info(
+                            f"Stored agent result for {job_id} in minio, size: {len(agent_result_bytes)} bytes"
+                        )
+
+                        requests.post(
+                            f"{TTS_SERVICE_URL}/generate_tts",
+                            json={
+                                "dialogue": agent_result["dialogue"],
+                                "job_id": job_id,
+                                "voice_mapping": transcription_params.voice_mapping,  # Forward the voice mapping
+                            },
+                        )
+                        current_service = ServiceType.TTS
+
+                    elif current_service == ServiceType.TTS:
+                        # Get final output and store it
+                        logger.info(
+                            f"TTS completed for {job_id}, fetching and storing result"
+                        )
+                        audio_content = requests.get(
+                            f"{TTS_SERVICE_URL}/output/{job_id}"
+                        ).content
+
+                        # Store in DB
+                        storage_manager.store_audio(
+                            transcription_params.userId,
+                            job_id,
+                            audio_content,
+                            f"{job_id}.mp3",
+                            transcription_params,
+                        )
+
+                        logger.info(
+                            f"Stored TTS result for {job_id}, size: {len(audio_content)} bytes, with TTL: {MP3_CACHE_TTL} seconds"
+                        )
+                        return audio_content
 
         except Exception as e:
             span.set_status(StatusCode.ERROR, "process_pdf_task failed")
             span.record_exception(e)
             logger.error(f"Job {job_id} failed: {str(e)}")
             raise
+        finally:
+            if job_updates is not None:
+                manager.unsubscribe_job(job_id, job_updates)
 
 
 @app.post("/process_pdf", status_code=202)
 async def process_pdf(
     background_tasks: BackgroundTasks,
-    target_files: Union[UploadFile, List[UploadFile]] = File(...),
-    context_files: Union[UploadFile, List[UploadFile]] = File([]),
+    target_files: List[UploadFile] = File(...),
+    context_files: List[UploadFile] = File([]),
     transcription_params: str = Form(...),
 ):
     """
@@ -357,8 +370,8 @@ async def process_pdf(
     
     Args:
         background_tasks (BackgroundTasks): FastAPI background tasks handler
-        target_files (Union[UploadFile, List[UploadFile]]): Primary PDF file(s) to process
-        context_files (Union[UploadFile, List[UploadFile]], optional): Supporting PDF files
+        target_files (List[UploadFile]): Primary PDF file(s) to process
+        context_files (List[UploadFile], optional): Supporting PDF files
         transcription_params (str): JSON string containing transcription parameters
         
     Returns:
@@ -368,29 +381,11 @@ async def process_pdf(
         HTTPException: If file validation fails or parameters are invalid
     """
     with telemetry.tracer.start_as_current_span("api.process_pdf") as span:
-        # Convert single file to list for consistent handling
-        target_files_list = (
-            [target_files] if isinstance(target_files, UploadFile) else target_files
-        )
-        context_files_list = (
-            [context_files] if isinstance(context_files, UploadFile) else context_files
-        )
-
         span.set_attribute("request", transcription_params)
-        span.set_attribute(
-            "num_files", len(target_files_list) + len(context_files_list)
-        )
+        span.set_attribute("num_files", len(target_files) + len(context_files))
 
         # Validate all files are PDFs
-        for file in target_files_list:
-            if file.content_type != "application/pdf":
-                span.set_status(
-                    status=StatusCode.ERROR, description="invalid file type"
-                )
-                raise HTTPException(
-                    status_code=400, detail="Only PDF files are allowed"
-                )
-        for file in context_files_list:
+        for file in target_files + context_files:
             if file.content_type != "application/pdf":
                 span.set_status(
                     status=StatusCode.ERROR, description="invalid file type"
@@ -400,10 +395,10 @@ async def process_pdf(
                 )
 
         try:
-            params_dict = json.loads(transcription_params)
-            params = TranscriptionParams.model_validate(params_dict)
+            # Parse and validate in one pass; malformed JSON also raises ValidationError
+            params = TranscriptionParams.model_validate_json(transcription_params)
             span.set_attribute("transcription_params", params.model_dump())
-        except (json.JSONDecodeError, ValidationError) as e:
+        except ValidationError as e:
             span.set_status(status=StatusCode.ERROR, description="invalid params")
             raise HTTPException(status_code=400, detail=str(e))
 
@@ -413,10 +408,10 @@ async def process_pdf(
 
         # Read target and context files
         files_and_types = []
-        for file in target_files_list:
+        for file in target_files:
             content = await file.read()
             files_and_types.append((content, "target"))
-        for file in context_files_list:
+        for file in context_files:
             content = await file.read()
             files_and_types.append((content, "context"))
 
@@ -499,7 +494,9 @@ async def get_output(job_id: str, userId: str = Query(..., description="KAS User
         result = redis_client.get(get_tts_result_key)
         if not result:
             logger.info(f"Final result not found in cache for {job_id}. Checking DB...")
-            result = storage_manager.get_podcast_audio(userId, job_id)
+            result = await asyncio.to_thread(
+                storage_manager.get_podcast_audio, userId, job_id
+            )
             if not result:
                 span.set_status(StatusCode.ERROR, "result not found")
                 raise HTTPException(status_code=404, detail="Result not found")
@@ -554,7 +551,9 @@ async def get_saved_podcasts(
                 raise HTTPException(status_code=400, detail="userId cannot be empty")
 
             # Pass userId to filter results - storage manager handles the filtering
-            saved_files = storage_manager.list_files_metadata(user_id=userId)
+            saved_files = await asyncio.to_thread(
+                storage_manager.list_files_metadata, user_id=userId
+            )
             span.set_attribute("num_files", len(saved_files))
             span.set_attribute("user_id", userId)
 
@@ -600,7 +599,9 @@ async def get_saved_podcast_metadata(
             "api.saved_podcast.metadata"
         ) as span:
             span.set_attribute("job_id", job_id)
-            saved_files = storage_manager.list_files_metadata(user_id=userId)
+            saved_files = await asyncio.to_thread(
+                storage_manager.list_files_metadata, user_id=userId
+            )
             podcast_metadata = next(
                 (file for file in saved_files if file["job_id"] == job_id), None
             )
@@ -644,7 +645,9 @@ async def get_saved_podcast(
         with telemetry.tracer.start_as_current_span("api.saved_podcast.audio") as span:
             span.set_attribute("job_id", job_id)
             # Get metadata first
-            saved_files = storage_manager.list_files_metadata(user_id=userId)
+            saved_files = await asyncio.to_thread(
+                storage_manager.list_files_metadata, user_id=userId
+            )
             podcast_metadata = next(
                 (file for file in saved_files if file["job_id"] == job_id), None
             )
@@ -655,7 +658,9 @@ async def get_saved_podcast(
                 )
 
             # Get audio data
-            audio_data = storage_manager.get_podcast_audio(userId, job_id)
+            audio_data = await asyncio.to_thread(
+                storage_manager.get_podcast_audio, userId, job_id
+            )
             if not audio_data:
                 raise HTTPException(
                     status_code=404, detail=f"Audio data for podcast {job_id} not found"
@@ -702,15 +707,16 @@ async def get_saved_podcast_transcript(
             span.set_attribute("job_id", job_id)
             filename = f"{job_id}_agent_result.json"
             span.set_attribute("filename", filename)
-            raw_data = storage_manager.get_file(userId, job_id, filename)
+            raw_data = await asyncio.to_thread(
+                storage_manager.get_file, userId, job_id, filename
+            )
 
             if not raw_data:
                 raise HTTPException(
                     status_code=404, detail=f"Transcript for {job_id} not found"
                 )
 
-            agent_result = json.loads(raw_data)
-            return Conversation.model_validate(agent_result)
+            return Conversation.model_validate_json(raw_data)
 
         except ValidationError as e:
             span.set_status(StatusCode.ERROR, "validation error")
@@ -748,7 +754,9 @@ async def get_saved_podcast_agent_workflow(
             span.set_attribute("job_id", job_id)
             filename = f"{job_id}_prompt_tracker.json"
             span.set_attribute("filename", filename)
-            raw_data = storage_manager.get_file(userId, job_id, filename)
+            raw_data = await asyncio.to_thread(
+                storage_manager.get_file, userId, job_id, filename
+            )
 
             if not raw_data:
                 span.set_status(StatusCode.ERROR, "not found")
@@ -788,7 +796,9 @@ async def get_saved_podcast_pdf(
             span.set_attribute("job_id", job_id)
             filename = f"{job_id}.pdf"
             span.set_attribute("filename", filename)
-            pdf_data = storage_manager.get_file(userId, job_id, filename)
+            pdf_data = await asyncio.to_thread(
+                storage_manager.get_file, userId, job_id, filename
+            )
 
             if not pdf_data:
                 span.set_status(StatusCode.ERROR, "not found")
@@ -819,7 +829,11 @@ async def delete_saved_podcast(
         try:
             span.set_attribute("job_id", job_id)
             # Convert generator to list before checking length
-            saved_files = list(storage_manager.list_files_metadata(user_id=userId))
+            saved_files = list(
+                await asyncio.to_thread(
+                    storage_manager.list_files_metadata, user_id=userId
+                )
+            )
             podcast_metadata = next(
                 (file for file in saved_files if file["job_id"] == job_id), None
             )
@@ -830,7 +844,9 @@ async def delete_saved_podcast(
                     status_code=404, detail=f"Podcast with job_id {job_id} not found"
                 )
 
-            success = storage_manager.delete_job_files(userId, job_id)
+            success = await asyncio.to_thread(
+                storage_manager.delete_job_files, userId, job_id
+            )
 
             if not success:
                 raise HTTPException(
@@ -919,7 +935,9 @@ async def health():
                     f"api.{service_name}_check"
                 ) as service_span:
                     try:
-                        response = requests.get(f"{url}/health", timeout=5)
+                        response = await asyncio.to_thread(
+                            requests.get, f"{url}/health", timeout=5
+                        )
                         status = "up" if response.status_code == 200 else "down"
                         service_span.set_attribute(f"{service_name}.status", status)
                         service_span.set_attribute(
@@ -55,6 +55,10 @@ config = OpenTelemetryConfig(
 )
 telemetry.initialize(config, app)
 
+# Model access configuration
+NVIDIA_API_KEY = os.getenv("NVIDIA_API_KEY")
+MODEL_CONFIG_PATH = os.getenv("MODEL_CONFIG_PATH")
+
 # Initialize managers
 job_manager = JobStatusManager(ServiceType.AGENT, telemetry=telemetry)
 storage_manager = StorageManager(telemetry=telemetry)
@@ -83,11 +87,11 @@ async def process_transcription(job_id: str, request: TranscriptionRequest):
         try:
             # Initialize LLM manager and prompt tracker
             llm_manager = LLMManager(
-                api_key=os.getenv("NVIDIA_API_KEY"),
+                api_key=NVIDIA_API_KEY,
                 telemetry=telemetry,
-                config_path=os.getenv("MODEL_CONFIG_PATH"),
+                config_path=MODEL_CONFIG_PATH,
             )
-            span.set_attribute("model_config_path", os.getenv("MODEL_CONFIG_PATH"))
+            span.set_attribute("model_config_path", MODEL_CONFIG_PATH)
             prompt_tracker = PromptTracker(job_id, request.userId, storage_manager)
 
             # Initialize processing
@@ -509,6 +509,10 @@ async def podcast_combine_dialogues(
         current_dialogue,
     )
 
+    # The template and outline are the same for every step, so build them once
+    template = PodcastPrompts.get_template("podcast_combine_dialogues_prompt")
+    outline_json = outline.model_dump_json()
+
     # Iteratively combine with subsequent segments
     for idx in range(1, len(segment_dialogues)):
         job_manager.update_status(
@@ -521,9 +525,8 @@ async def podcast_combine_dialogues(
         prompt_tracker.update_result(f"segment_dialogue_{idx}", next_section)
         current_section = segment_dialogues[idx]["section"]
 
-        template = PodcastPrompts.get_template("podcast_combine_dialogues_prompt")
         prompt = template.render(
-            outline=outline.model_dump_json(),
+            outline=outline_json,
             dialogue_transcript=current_dialogue,
             next_section=next_section,
             current_section=current_section,
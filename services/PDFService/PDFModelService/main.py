@@ -1,6 +1,8 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from celery.result import AsyncResult
+import asyncio
 import os
+import shutil
 import logging
 from typing import Dict, List
 import uuid
@@ -38,12 +40,12 @@ async def convert_pdf(files: List[UploadFile] = File(...)) -> Dict[str, str]:
                     status_code=400, detail=f"File {file.filename} must be a PDF"
                 )
 
-            file_id = str(uuid.uuid4())
+            file_id = uuid.uuid4().hex
             temp_file_path = os.path.join(temp_dir, f"{file_id}.pdf")
-            content = await file.read()
-            with open(temp_file_path, "wb") as temp_file:
-                temp_file.write(content)
             file_paths.append(temp_file_path)
+            with open(temp_file_path, "wb") as temp_file:
+                # Copy the spooled upload in chunks, off the event loop
+                await asyncio.to_thread(shutil.copyfileobj, file.file, temp_file)
 
         # Start batch conversion
         convert_pdf_task = get_celery_task()
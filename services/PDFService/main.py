@@ -4,6 +4,7 @@ from shared.otel import OpenTelemetryInstrumentation, OpenTelemetryConfig
 from opentelemetry.trace.status import StatusCode
 import httpx
 import tempfile
+import shutil
 import os
 import logging
 import asyncio
@@ -155,97 +156,66 @@ async def convert_pdfs_to_markdown(
 
 async def convert_pdfs(
     job_id: str,
-    contents: List[bytes],
+    temp_files: List[str],
     filenames: List[str],
     types: List[str],
     vdb_task: bool = False,
 ):
-    """Process multiple PDFs and return metadata for each"""
+    """Process multiple spooled PDFs and return metadata for each"""
     with telemetry.tracer.start_as_current_span("pdf.convert_pdfs") as span:
         try:
             logger.info(
-                f"Starting PDF processing for job {job_id} with {len(contents)} files"
+                f"Starting PDF processing for job {job_id} with {len(temp_files)} files"
             )
             job_manager.update_status(
-                job_id, JobStatus.PROCESSING, f"Processing {len(contents)} PDFs"
+                job_id, JobStatus.PROCESSING, f"Processing {len(temp_files)} PDFs"
             )
 
-            # Create temporary files for all PDFs
-            temp_files = []
-            for i, content in enumerate(contents):
+            logger.info(
+                f"Starting PDF to Markdown conversion for {len(temp_files)} files"
+            )
+            # Convert all PDFs in a single batch
+            results = await convert_pdfs_to_markdown(temp_files, job_id, vdb_task)
+            logger.info(f"Conversion completed, processing {len(results)} results")
+
+            # Create metadata list
+            pdf_metadata_list = []
+            for filename, result, type in zip(filenames, results, types):
                 try:
-                    with tempfile.NamedTemporaryFile(
-                        delete=False, suffix=".pdf"
-                    ) as temp_file:
-                        temp_file.write(content)
-                        temp_files.append(temp_file.name)
-                        logger.debug(
-                            f"Created temp file {temp_file.name} for PDF {i+1}/{len(contents)}"
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create temporary file for PDF {i+1}: {str(e)}"
+                    metadata = PDFMetadata(
+                        filename=filename,
+                        markdown=result.content
+                        if result.status == ConversionStatus.SUCCESS
+                        else "",
+                        type=type,
+                        status=result.status,
+                        error=result.error,
+                    )
+                    pdf_metadata_list.append(metadata)
+                    logger.debug(
+                        f"Created metadata for {filename}: status={result.status}"
                     )
+                except Exception as e:
+                    logger.error(f"Failed to create metadata for {filename}: {str(e)}")
                     raise
 
-            try:
-                logger.info(
-                    f"Starting PDF to Markdown conversion for {len(temp_files)} files"
-                )
-                # Convert all PDFs in a single batch
-                results = await convert_pdfs_to_markdown(temp_files, job_id, vdb_task)
-                logger.info(f"Conversion completed, processing {len(results)} results")
-
-                # Create metadata list
-                pdf_metadata_list = []
-                for filename, result, type in zip(filenames, results, types):
-                    try:
-                        metadata = PDFMetadata(
-                            filename=filename,
-                            markdown=result.content
-                            if result.status == ConversionStatus.SUCCESS
-                            else "",
-                            type=type,
-                            status=result.status,
-                            error=result.error,
-                        )
-                        pdf_metadata_list.append(metadata)
-                        logger.debug(
-                            f"Created metadata for {filename}: status={result.status}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create metadata for {filename}: {str(e)}"
-                        )
-                        raise
-
-                # Store result - convert datetime to ISO format string
-                logger.info("Serializing metadata for storage")
-                serialized_metadata = [
-                    {**m.model_dump(), "created_at": m.created_at.isoformat()}
-                    for m in pdf_metadata_list
-                ]
-
-                job_manager.set_result(
-                    job_id,
-                    json.dumps(serialized_metadata).encode(),
-                )
-                logger.info(f"Successfully stored results for job {job_id}")
+            # Store result - convert datetime to ISO format string
+            logger.info("Serializing metadata for storage")
+            serialized_metadata = [
+                {**m.model_dump(), "created_at": m.created_at.isoformat()}
+                for m in pdf_metadata_list
+            ]
 
-                job_manager.update_status(
-                    job_id, JobStatus.COMPLETED, "All PDFs processed successfully"
-                )
-                logger.info(f"Job {job_id} marked as completed successfully")
-
-            finally:
-                # Clean up all temporary files
-                logger.info(f"Starting cleanup of {len(temp_files)} temporary files")
-                for temp_file in temp_files:
-                    try:
-                        os.unlink(temp_file)
-                        logger.info(f"Cleaned up temporary file: {temp_file}")
-                    except Exception as e:
-                        logger.error(f"Error cleaning up file {temp_file}: {e}")
+            job_manager.set_result(
+                job_id,
+                json.dumps(serialized_metadata).encode(),
+            )
+            logger.info(f"Successfully stored results for job {job_id}")
+
+            job_manager.update_status(
+                job_id, JobStatus.COMPLETED, "All PDFs processed successfully"
+            )
+            logger.info(f"Job {job_id} marked as completed successfully")
 
         except Exception as e:
             error_msg = f"Error processing PDFs: {str(e)}"
@@ -256,6 +226,15 @@ async def convert_pdfs(
                 job_id, JobStatus.FAILED, f"PDF conversion failed: {str(e)}"
             )
             raise
+        finally:
+            # Clean up all temporary files
+            logger.info(f"Starting cleanup of {len(temp_files)} temporary files")
+            for temp_file in temp_files:
+                try:
+                    os.unlink(temp_file)
+                    logger.info(f"Cleaned up temporary file: {temp_file}")
+                except Exception as e:
+                    logger.error(f"Error cleaning up file {temp_file}: {e}")
 
 
 @app.post("/convert", status_code=202)
@@ -275,22 +254,32 @@ async def convert_pdf(
                 raise HTTPException(status_code=400, detail="All files must be PDFs")
             span.set_attribute(f"file_{file.filename}_size", file.size)
 
-        # Read all file contents and filenames
-        contents = []
+        # Spool uploads to temporary files so PDFs are never held in memory whole
+        temp_files = []
         filenames = []
         file_types = []
-        for file, type in zip(files, types):
-            content = await file.read()
-            contents.append(content)
-            filenames.append(file.filename)
-            file_types.append(type)
-
-        span.set_attribute("num_files", len(files))
-        job_manager.create_job(job_id)
+        try:
+            for file, type in zip(files, types):
+                with tempfile.NamedTemporaryFile(
+                    delete=False, suffix=".pdf"
+                ) as temp_file:
+                    temp_files.append(temp_file.name)
+                    # Copy off the event loop; both the read and the write hit disk
+                    await asyncio.to_thread(shutil.copyfileobj, file.file, temp_file)
+                filenames.append(file.filename)
+                file_types.append(type)
+
+            span.set_attribute("num_files", len(files))
+            job_manager.create_job(job_id)
+        except Exception as e:
+            logger.error(f"Failed to start conversion for job {job_id}: {e}")
+            for temp_file in temp_files:
+                os.unlink(temp_file)
+            raise
 
         # Start processing in background
         background_tasks.add_task(
-            convert_pdfs, job_id, contents, filenames, file_types, vdb_task
+            convert_pdfs, job_id, temp_files, filenames, file_types, vdb_task
         )
 
         return {"job_id": job_id}
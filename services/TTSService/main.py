@@ -152,7 +152,8 @@ class TTSService:
     async def _process_dialogue(
         self, job_id: str, dialogue: List[DialogueEntry], voice_mapping: Dict[str, str]
     ) -> bytes:
-        combined_audio = b""
+        # Collect chunks and join once; repeated bytes += recopies the whole buffer
+        audio_chunks: List[bytes] = []
         with telemetry.tracer.start_as_current_span("tts.process_dialogue") as span:
             tasks = [
                 (
@@ -180,11 +181,13 @@ class TTSService:
                     for text, voice_id in batch
                 ]
                 for future in futures:
-                    combined_audio += await asyncio.get_event_loop().run_in_executor(
-                        None, future.result
+                    audio_chunks.append(
+                        await asyncio.get_event_loop().run_in_executor(
+                            None, future.result
+                        )
                     )
 
-            return combined_audio
+            return b"".join(audio_chunks)
 
     def _convert_text(self, text: str, voice_id: str) -> bytes:
         """Convert text to speech using ElevenLabs"""
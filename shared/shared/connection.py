@@ -3,10 +3,9 @@ from typing import Dict, Set
 import redis
 import ujson as json
 import logging
-import time
 import asyncio
 from collections import defaultdict
-from threading import Thread
+from threading import Event, Lock, Thread
 import queue
 
 logging.basicConfig(level=logging.INFO)
@@ -21,12 +20,14 @@ class ConnectionManager:
     - WebSocket connections for each job ID
     - Redis pub/sub subscription for status updates
     - Broadcasting messages to connected clients
+    - Fanning updates out to in-process job subscribers from the single subscription
     - Connection cleanup and resource management
     
     Attributes:
         active_connections (Dict[str, Set[WebSocket]]): Maps job IDs to sets of active WebSocket connections
         pubsub: Redis pub/sub connection
-        message_queue (Queue): Thread-safe queue for message processing
+        message_queue (asyncio.Queue): Queue the Redis thread hands updates to for broadcasting
+        job_queues (Dict[str, Set[queue.Queue]]): Maps job IDs to queues of in-process subscribers
         redis_thread (Thread): Background thread for Redis subscription
         should_stop (bool): Flag to control background thread termination
         redis_client (redis.Redis): Redis client instance
@@ -41,8 +42,12 @@ class ConnectionManager:
         """
         self.active_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
         self.pubsub = None
-        self.message_queue = queue.Queue()
+        self.message_queue = None
+        self.job_queues: Dict[str, Set[queue.Queue]] = defaultdict(set)
         self.redis_thread = None
+        self._loop = None
+        self._listener_lock = Lock()
+        self._subscribed = Event()
         self.should_stop = False
         self.redis_client = redis_client
 
@@ -60,14 +65,15 @@ class ConnectionManager:
             f"New WebSocket connection for job {job_id}. Total connections: {len(self.active_connections[job_id])}"
         )
 
-        # Start Redis listener if not already running
-        if self.redis_thread is None:
-            self.redis_thread = Thread(target=self._redis_listener)
-            self.redis_thread.daemon = True
-            self.redis_thread.start()
-            # Start the async message processor
+        # Start the async message processor if not already running
+        if self._loop is None:
+            # The queue must be bound to the running loop, so it is created lazily here
+            self.message_queue = asyncio.Queue()
+            self._loop = asyncio.get_running_loop()
             asyncio.create_task(self._process_messages())
 
+        self._start_listener()
+
     def disconnect(self, websocket: WebSocket, job_id: str):
         """
         Remove a WebSocket connection for a job.
@@ -84,80 +90,164 @@ class ConnectionManager:
                 f"WebSocket disconnected for job {job_id}. Remaining connections: {len(self.active_connections[job_id]) if job_id in self.active_connections else 0}"
             )
 
+    def subscribe_job(self, job_id: str) -> queue.Queue:
+        """
+        Register an in-process subscriber for a job's status updates.
+        
+        Updates are delivered from the shared Redis subscription, so any number
+        of subscribers costs a single pub/sub connection. Safe to call from
+        worker threads.
+        
+        Args:
+            job_id (str): ID of the job to receive updates for
+            
+        Returns:
+            queue.Queue: Queue that receives each decoded update for the job,
+                followed by None if the shared subscription is lost
+
+        Raises:
+            ConnectionError: If the Redis subscription is not established in time
+        """
+        job_queue = queue.Queue()
+        with self._listener_lock:
+            self.job_queues[job_id].add(job_queue)
+        self._start_listener()
+        # Don't hand back the queue until updates published from now on will reach it
+        if not self._subscribed.wait(timeout=5.0):
+            self.unsubscribe_job(job_id, job_queue)
+            raise ConnectionError("Timed out subscribing to Redis status updates")
+        return job_queue
+
+    def unsubscribe_job(self, job_id: str, job_queue: queue.Queue):
+        """
+        Remove an in-process subscriber registered with subscribe_job.
+        
+        Args:
+            job_id (str): ID of the job the queue was registered for
+            job_queue (queue.Queue): Queue returned by subscribe_job
+        """
+        with self._listener_lock:
+            if job_id in self.job_queues:
+                self.job_queues[job_id].discard(job_queue)
+                if not self.job_queues[job_id]:
+                    del self.job_queues[job_id]
+
+    def is_listening(self) -> bool:
+        """
+        Check whether the Redis listener thread is running.
+
+        Returns:
+            bool: True if the shared subscription is alive
+        """
+        return self.redis_thread is not None and self.redis_thread.is_alive()
+
+    def _start_listener(self):
+        """
+        Start the Redis listener thread if it is not already running.
+        """
+        with self._listener_lock:
+            if self.redis_thread is None:
+                self.redis_thread = Thread(target=self._redis_listener)
+                self.redis_thread.daemon = True
+                self.redis_thread.start()
+
     def _redis_listener(self):
         """
         Background thread that listens for Redis pub/sub messages.
         
-        Subscribes to the status_updates:all channel and queues received messages
-        for processing by the async message processor.
+        Subscribes to the status_updates:all channel, decodes each message once
+        and hands it to the job's in-process subscribers and the async message
+        processor. Blocks on the pub/sub socket instead of polling, so an idle
+        channel costs no wakeups beyond the stop-flag check.
         """
         try:
             self.pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
             self.pubsub.subscribe("status_updates:all")
+            self._subscribed.set()
             logger.info("Successfully subscribed to Redis status_updates:all channel")
 
             while not self.should_stop:
-                message = self.pubsub.get_message()
+                # Wait for the next message; the timeout only bounds shutdown latency
+                message = self.pubsub.get_message(timeout=1.0)
                 if message and message["type"] == "message" and "data" in message:
                     data = message["data"].decode("utf-8")
                     try:
-                        job_update = json.loads(data)
-                        logger.info(
-                            f"Received message for job {job_update.get('job_id')}"
-                        )
+                        update = json.loads(data)
                     except json.JSONDecodeError:
-                        logger.error("Invalid JSON in Redis message")
-                    # Put message in queue for processing regardless of logging logic error
-                    finally:
-                        self.message_queue.put(data)
-                time.sleep(0.01)  # Prevent tight loop
+                        logger.error(f"Invalid JSON in Redis message: {data}")
+                        continue
+                    if not isinstance(update, dict):
+                        logger.error(f"Unexpected Redis message payload: {data}")
+                        continue
+
+                    with self._listener_lock:
+                        job_queues = list(self.job_queues.get(update.get("job_id"), ()))
+                    for job_queue in job_queues:
+                        job_queue.put(update)
+
+                    if self._loop is not None:
+                        try:
+                            self._loop.call_soon_threadsafe(
+                                self.message_queue.put_nowait, update
+                            )
+                        except RuntimeError:
+                            # A closed loop only ends websocket broadcasts, not the subscription
+                            logger.warning(
+                                "Event loop closed, stopping websocket broadcasts"
+                            )
+                            self._loop = None
 
         except Exception as e:
             logger.error(f"Redis subscription error: {e}")
         finally:
-            if self.pubsub:
-                self.pubsub.unsubscribe()
-                self.pubsub.close()
+            try:
+                if self.pubsub:
+                    self.pubsub.unsubscribe()
+                    self.pubsub.close()
+            except Exception as e:
+                logger.error(f"Error closing Redis subscription: {e}")
+            finally:
+                # Let the next connect or subscribe_job start a fresh listener, and
+                # wake current job subscribers since they may have missed updates
+                with self._listener_lock:
+                    self._subscribed.clear()
+                    self.redis_thread = None
+                    job_queues = [q for qs in self.job_queues.values() for q in qs]
+                    self.job_queues.clear()
+                for job_queue in job_queues:
+                    job_queue.put(None)
 
     async def _process_messages(self):
         """
         Async task that processes queued messages and broadcasts them to clients.
         
-        Continuously checks the message queue and broadcasts valid messages
-        to all connected WebSocket clients for the relevant job ID.
+        Waits on the message queue and broadcasts valid messages to all
+        connected WebSocket clients for the relevant job ID.
         """
         while True:
             try:
-                # Check queue in a non-blocking way
-                while not self.message_queue.empty():
-                    message: str = self.message_queue.get_nowait()
-                    try:
-                        update = json.loads(message)
-                        job_id = update.get("job_id")
-                        logger.info(f"Processing message for job {job_id}")
-
-                        if job_id and job_id in self.active_connections:
-                            logger.info(
-                                f"Broadcasting update for job {job_id} to {len(self.active_connections[job_id])} connections"
-                            )
-                            await self.broadcast_to_job(
-                                job_id,
-                                {
-                                    "service": update.get("service"),
-                                    "status": update.get("status"),
-                                    "message": update.get("message", ""),
-                                },
-                            )
-                            logger.info(
-                                f"Broadcasted update for job {job_id}: {update.get('service')} - {update.get('status')}"
-                            )
-                    except json.JSONDecodeError:
-                        logger.error(f"Invalid JSON in Redis message: {message}")
-                    except Exception as e:
-                        logger.error(f"Error processing Redis message: {e}")
+                update: dict = await self.message_queue.get()
+                try:
+                    job_id = update.get("job_id")
+                    logger.info(f"Processing message for job {job_id}")
 
-                # Small delay before next check
-                await asyncio.sleep(0.01)
+                    if job_id and job_id in self.active_connections:
+                        logger.info(
+                            f"Broadcasting update for job {job_id} to {len(self.active_connections[job_id])} connections"
+                        )
+                        await self.broadcast_to_job(
+                            job_id,
+                            {
+                                "service": update.get("service"),
+                                "status": update.get("status"),
+                                "message": update.get("message", ""),
+                            },
+                        )
+                        logger.info(
+                            f"Broadcasted update for job {job_id}: {update.get('service')} - {update.get('status')}"
+                        )
+                except Exception as e:
+                    logger.error(f"Error processing Redis message: {e}")
 
             except Exception as e:
                 logger.error(f"Message processing error: {e}")
@@ -193,7 +283,9 @@ class ConnectionManager:
         Stops the Redis listener thread and closes the pub/sub connection.
         """
         self.should_stop = True
-        if self.redis_thread:
-            self.redis_thread.join(timeout=1.0)
+        # The listener clears redis_thread on exit, so join through a local reference
+        redis_thread = self.redis_thread
+        if redis_thread:
+            redis_thread.join(timeout=1.0)
         if self.pubsub:
             self.pubsub.close()
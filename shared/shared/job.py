@@ -40,6 +40,23 @@ class JobStatusManager:
         self.service_type = service_type
         self._lock = threading.Lock()
 
+    def _write_status(self, hset_key: str, update: dict):
+        """
+        Store a status update and publish it in a single Redis round trip.
+        
+        Args:
+            hset_key (str): Redis hash key holding the job's status
+            update (dict): Status fields to store and broadcast
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(
+            hset_key,
+            mapping={k: str(v).encode() for k, v in update.items()},
+        )
+        # Encode the update dict as JSON bytes
+        pipe.publish("status_updates:all", json.dumps(update).encode())
+        pipe.execute()
+
     def create_job(self, job_id: str):
         """
         Create a new job with pending status.
@@ -56,14 +73,9 @@ class JobStatusManager:
                 "service": self.service_type,
                 "timestamp": time.time(),
             }
-            # Encode the update dict as JSON bytes
             hset_key = f"status:{job_id}:{str(self.service_type)}"
             span.set_attribute("hset_key", hset_key)
-            self.redis.hset(
-                hset_key,
-                mapping={k: str(v).encode() for k, v in update.items()},
-            )
-            self.redis.publish("status_updates:all", json.dumps(update).encode())
+            self._write_status(hset_key, update)
 
     def update_status(self, job_id: str, status: str, message: str):
         """
@@ -83,14 +95,9 @@ class JobStatusManager:
                 "service": self.service_type,
                 "timestamp": time.time(),
             }
-            # Encode the update dict as JSON bytes
             hset_key = f"status:{job_id}:{str(self.service_type)}"
             span.set_attribute("hset_key", hset_key)
-            self.redis.hset(
-                hset_key,
-                mapping={k: str(v).encode() for k, v in update.items()},
-            )
-            self.redis.publish("status_updates:all", json.dumps(update).encode())
+            self._write_status(hset_key, update)
 
     def set_result(self, job_id: str, result: bytes):
         """
@@ -1,16 +1,66 @@
 from langchain_nvidia_ai_endpoints import ChatNVIDIA
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
+import threading
 import ujson as json
 from shared.otel import OpenTelemetryInstrumentation
 from opentelemetry.trace.status import StatusCode
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 from langchain_core.messages import AIMessage
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed config files keyed by path, stored with the mtime they were read at
+_CONFIG_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """Read a model configuration file, reusing the parsed result until it changes.
+
+    Args:
+        config_path (Path): Path to configuration JSON file
+
+    Returns:
+        Dict[str, Any]: Parsed configuration. Callers must not mutate it.
+    """
+    key = str(config_path)
+    mtime = config_path.stat().st_mtime
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    # Parse the raw bytes directly rather than going through a text-mode reader
+    custom_configs = json.loads(config_path.read_bytes())
+
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = (mtime, custom_configs)
+    return custom_configs
+
+
+@lru_cache(maxsize=32)
+def _build_chat_model(name: str, api_base: str, api_key: Optional[str]) -> ChatNVIDIA:
+    """Create a ChatNVIDIA client, shared by every LLMManager with the same settings.
+
+    Args:
+        name (str): Name/identifier of the model
+        api_base (str): Base URL for the model's API endpoint
+        api_key (Optional[str]): API key for NVIDIA endpoints
+
+    Returns:
+        ChatNVIDIA: Initialized ChatNVIDIA instance
+    """
+    return ChatNVIDIA(
+        model=name,
+        base_url=api_base,
+        nvidia_api_key=api_key,
+        max_tokens=None,
+    )
+
 
 @dataclass
 class ModelConfig:
@@ -118,9 +168,7 @@ class LLMManager:
             try:
                 config_path = Path(config_path)
                 if config_path.exists():
-                    with config_path.open() as f:
-                        custom_configs = json.load(f)
-                    configs.update(custom_configs)
+                    configs.update(_read_config_file(config_path))
                 else:
                     logger.warning(
                         f"Config file {config_path} not found, using default configurations"
@@ -146,11 +194,8 @@ class LLMManager:
             raise ValueError(f"Unknown model key: {model_key}")
         if model_key not in self._llm_cache:
             config = self.model_configs[model_key]
-            self._llm_cache[model_key] = ChatNVIDIA(
-                model=config.name,
-                base_url=config.api_base,
-                nvidia_api_key=self.api_key,
-                max_tokens=None,
+            self._llm_cache[model_key] = _build_chat_model(
+                config.name, config.api_base, self.api_key
             )
         return self._llm_cache[model_key]
 
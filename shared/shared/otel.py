@@ -5,11 +5,6 @@ import os
 
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.redis import RedisInstrumentor
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
@@ -123,22 +118,33 @@ class OpenTelemetryInstrumentation:
             app: Optional FastAPI application instance to instrument
             
         Enables instrumentation for FastAPI (if app provided) and optionally for
-        Redis, requests, HTTPX, and urllib3 based on configuration.
+        Redis, requests, HTTPX, and urllib3 based on configuration. Instrumentors
+        are imported lazily since each one pulls in the library it wraps.
         """
         # Instrument FastAPI
         if app:
+            from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
             FastAPIInstrumentor.instrument_app(app)
 
         # Instrument Redis if enabled
         if self._config.enable_redis:
+            from opentelemetry.instrumentation.redis import RedisInstrumentor
+
             RedisInstrumentor().instrument()
 
         # Instrument requests library if enabled
         if self._config.enable_requests:
+            from opentelemetry.instrumentation.requests import RequestsInstrumentor
+
             RequestsInstrumentor().instrument()
 
         if self._config.enable_httpx:
+            from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+
             HTTPXClientInstrumentor().instrument()
 
         if self._config.enable_urllib3:
+            from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
+
             URLLib3Instrumentor().instrument()
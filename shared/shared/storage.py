@@ -21,6 +21,7 @@ MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "minio:9000")
 MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
 MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minioadmin")
 MINIO_BUCKET_NAME = os.getenv("MINIO_BUCKET_NAME", "audio-results")
+MINIO_SECURE = os.getenv("MINIO_SECURE", "false").lower() == "true"
 
 
 # TODO: use this to wrap redis as well
@@ -62,14 +63,14 @@ class StorageManager:
                 ),
             )
             self.client = Minio(
-                os.getenv("MINIO_ENDPOINT", "minio:9000"),
-                access_key=os.getenv("MINIO_ACCESS_KEY", "minioadmin"),
-                secret_key=os.getenv("MINIO_SECRET_KEY", "minioadmin"),
-                secure=os.getenv("MINIO_SECURE", "false").lower() == "true",
+                MINIO_ENDPOINT,
+                access_key=MINIO_ACCESS_KEY,
+                secret_key=MINIO_SECRET_KEY,
+                secure=MINIO_SECURE,
                 http_client=http_client,
             )
 
-            self.bucket_name = os.getenv("MINIO_BUCKET_NAME", "audio-results")
+            self.bucket_name = MINIO_BUCKET_NAME
             self._ensure_bucket_exists()
             logger.info("Successfully initialized MinIO storage")
 
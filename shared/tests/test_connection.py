@@ -0,0 +1,84 @@
+"""Tests for ConnectionManager's shared Redis subscription and job fan-out."""
+
+import queue
+
+import fakeredis
+import pytest
+import redis
+import ujson as json
+from shared.connection import ConnectionManager
+
+
+def publish(redis_client, job_id, status):
+    redis_client.publish(
+        "status_updates:all",
+        json.dumps({"job_id": job_id, "status": status, "service": "pdf"}),
+    )
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def manager(redis_client):
+    manager = ConnectionManager(redis_client=redis_client)
+    yield manager
+    manager.cleanup()
+
+
+def test_updates_fan_out_to_matching_job_only(manager, redis_client):
+    job_a = manager.subscribe_job("job-a")
+    job_b = manager.subscribe_job("job-b")
+
+    publish(redis_client, "job-a", "processing")
+
+    assert job_a.get(timeout=5)["status"] == "processing"
+    with pytest.raises(queue.Empty):
+        job_b.get(timeout=0.5)
+
+
+def test_unsubscribed_queue_stops_receiving(manager, redis_client):
+    job_updates = manager.subscribe_job("job-a")
+    manager.unsubscribe_job("job-a", job_updates)
+
+    publish(redis_client, "job-a", "processing")
+
+    assert "job-a" not in manager.job_queues
+    with pytest.raises(queue.Empty):
+        job_updates.get(timeout=0.5)
+
+
+def test_malformed_payloads_are_skipped(manager, redis_client):
+    job_updates = manager.subscribe_job("job-a")
+
+    redis_client.publish("status_updates:all", "not json")
+    redis_client.publish("status_updates:all", json.dumps(["job-a"]))
+    redis_client.publish("status_updates:all", json.dumps("job-a"))
+    publish(redis_client, "job-a", "processing")
+
+    # Bad messages are dropped without taking down the shared listener
+    assert job_updates.get(timeout=5)["status"] == "processing"
+    assert manager.is_listening()
+
+
+def test_listener_failure_wakes_subscribers_and_restarts(
+    manager, redis_client, monkeypatch
+):
+    job_updates = manager.subscribe_job("job-a")
+
+    def broken_get_message(*args, **kwargs):
+        raise redis.ConnectionError("connection lost")
+
+    monkeypatch.setattr(manager.pubsub, "get_message", broken_get_message)
+
+    # The lost subscription is signalled instead of leaving the job waiting
+    assert job_updates.get(timeout=5) is None
+    assert not manager.is_listening()
+
+    # The next subscriber starts a fresh listener
+    job_updates = manager.subscribe_job("job-a")
+    assert manager.is_listening()
+    publish(redis_client, "job-a", "completed")
+    assert job_updates.get(timeout=5)["status"] == "completed"